@@ -1,8 +1,101 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+import tempfile
 import pandas as pd
 import os
+import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 
+# Shared session so the edges and nodes fetches (and any later SigDat builds)
+# reuse one keep-alive connection to docs.google.com
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+
+# on-disk copies of fetched sheets, revalidated against the sheet's ETag
+_CACHE_DIR = Path.home() / '.cache' / 'sig'
+
+
+@lru_cache(maxsize=32)
+def _fetch_sheet(sheet_id, gid):
+    """
+    Read one tab of a public Google Sheet into a DataFrame.
+
+    Results are memoised per (sheet_id, gid) for the life of the process. On a
+    memory miss, a conditional GET is sent with the ETag of the last download;
+    if the sheet is unchanged (304) the CSV saved from that download is parsed
+    instead of downloading it again.
+    """
+    csv_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv&gid={gid}"
+
+    etag_path = _CACHE_DIR / f"{sheet_id}_{gid}.etag"
+    data_path = _CACHE_DIR / f"{sheet_id}_{gid}.csv"
+
+    headers = {}
+    if etag_path.exists() and data_path.exists():
+        headers['If-None-Match'] = etag_path.read_text()
+
+    r = _SESSION.get(csv_url, headers=headers, timeout=30)
+    if r.status_code == 304:
+        content = data_path.read_bytes()
+    else:
+        r.raise_for_status()
+        content = r.content
+        etag = r.headers.get('ETag')
+        if etag:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            _write_atomic(data_path, lambda tmp: Path(tmp).write_bytes(content))
+            _write_atomic(etag_path, lambda tmp: Path(tmp).write_text(etag))
+
+    # always parse the raw CSV, so cached and fresh sheets come out the same
+    return pd.read_csv(io.BytesIO(content))
+
+
+def _write_atomic(path, write):
+    """Call write(tmp_path) on a temp file next to path, then move it into place"""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _strip(col):
+    """Strip surrounding whitespace from a column of strings"""
+    # is_string_dtype covers both object and pandas 3's default str dtype
+    if pd.api.types.is_string_dtype(col):
+        return col.str.strip()
+    return col
+
+
+def _replace_columns(df, new_cols):
+    """
+    Return df with some columns swapped out, leaving df itself untouched.
+
+    Sheets are shared through the fetch cache, so they can't be edited in
+    place; a shallow copy with whole columns replaced avoids the deep copy
+    DataFrame.assign makes when copy-on-write is off (the pandas 2 default).
+    """
+    out = df.copy(deep=False)
+    for name, col in new_cols.items():
+        out[name] = col
+    return out
+
+
+@lru_cache(maxsize=2)
+def _load_env(data_source):
+    """Load the env file for a data source, once per process"""
+    if data_source == "template":
+        load_dotenv('client_credentials/.env')
+    elif data_source == "client":
+        load_dotenv('client_credentials/.env-client', override=True)
+
 
 class SigDat:
     """
@@ -11,8 +104,23 @@ class SigDat:
 
     This function will not work if client_credentials/.env does not have 
     DATA_ENTRY variable set.
+
+    Use SigDat.cached(data_source) to share one loaded instance per
+    (data_source, sheet id) across a session.
     """
-    
+
+    _cache = {}
+
+    @classmethod
+    def cached(cls, data_source="template"):
+        """Return the memoised SigDat for a data source, building it on first use"""
+        # env must be loaded before the sheet id can key the cache
+        _load_env(data_source)
+        key = (cls, data_source, os.getenv('GS_SHEET_ID'))
+        if key not in cls._cache:
+            cls._cache[key] = cls(data_source)
+        return cls._cache[key]
+
     def __init__(self, data_source="template"):
         """
         Initialize SigDat with data loading and preparation
@@ -27,17 +135,36 @@ class SigDat:
 
         """
         # Load environment variables from client_credentials/.env
-
-        if data_source == "template":
-            load_dotenv('client_credentials/.env')
-        elif data_source == "client":
-            load_dotenv('client_credentials/.env-client', override=True)
-        
+        _load_env(data_source)
 
         self._sheet_id = os.getenv('GS_SHEET_ID') 
 
-        self.edges_df = self._load_data('edges')# .set_index(['from', 'to'])
-        self.nodes_df = self._load_data('nodes')# .set_index(['node', 'role_context'])
+        self.load_data()
+
+    def load_data(self):
+        """Load and prepare the edges and nodes sheets"""
+        # fetch both sheets in parallel; each is a round-trip to the same host
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            f_e = ex.submit(self._load_data, 'edges')
+            f_n = ex.submit(self._load_data, 'nodes')
+            self.edges_df = self._prepare_edges_dataframe(f_e.result())# .set_index(['from', 'to'])
+            self.nodes_df = self._prepare_nodes_dataframe(f_n.result())# .set_index(['node', 'role_context'])
+
+    def refresh(self):
+        """
+        Reload both sheets in place, bypassing the in-memory sheet cache.
+
+        Unchanged sheets are still served from the on-disk cache after ETag
+        revalidation.
+
+        SigGraph and SigVis objects built before the refresh keep the old
+        edges_df/nodes_df and their cached graph and layouts, so rebuild them
+        afterwards; new ones built via SigDat.cached() pick up the refreshed
+        instance.
+        """
+        _fetch_sheet.cache_clear()
+        self.load_data()
+        return self
 
         # helpers   
     def _load_data(self, sheet_name):
@@ -49,9 +176,27 @@ class SigDat:
             GID = os.getenv('GS_GID_NODES')
         else:
             raise ValueError("sheet_name must be 'edges' or 'nodes'")
-        
-        # construct csv url
-        csv_url = f"https://docs.google.com/spreadsheets/d/{self._sheet_id}/export?format=csv&gid={GID}"
 
-        # read data from csv url
-        return pd.read_csv(csv_url)
+        # read data from the (cached) csv export
+        return _fetch_sheet(self._sheet_id, GID)
+
+    def _prepare_edges_dataframe(self, edges_df):
+        """Strip identifier and label columns and store them as categoricals"""
+        cat_cols = [c for c in ('from', 'to', 'from_parent', 'to_parent', 'arrowkeeper', 'status')
+                    if c in edges_df.columns]
+
+        return _replace_columns(
+            edges_df, {c: _strip(edges_df[c]).astype('category') for c in cat_cols}
+        )
+
+    def _prepare_nodes_dataframe(self, nodes_df):
+        """
+        Strip node labels and role_context the same way as edge columns, and
+        store the low-cardinality role_context column as a categorical
+        """
+        new_cols = {}
+        if 'node' in nodes_df.columns:
+            new_cols['node'] = _strip(nodes_df['node'])
+        if 'role_context' in nodes_df.columns:
+            new_cols['role_context'] = _strip(nodes_df['role_context']).astype('category')
+        return _replace_columns(nodes_df, new_cols)
@@ -1,14 +1,9 @@
+from functools import cached_property
+import numpy as np
 import pandas as pd
-import os
-import gspread
-from google.auth import default
-from dotenv import load_dotenv
 import networkx as nx
 from scripts.classes.sig_dat import SigDat
 
-# Load environment variables from client_credentials/.env
-load_dotenv('client_credentials/.env')
-
 class SigGraph:
     """
     Graph object creation and network analysis layer.
@@ -23,37 +18,93 @@ class SigGraph:
         - data_path: Path to data file or URL
         - sheet_id: Google Sheets ID for direct access
         """
-        self.sig_dat = SigDat(data_path)
+        # SigDat loads the env file for its data source; default to the template
+        self.sig_dat = SigDat.cached(data_path or "template")
         self.edges_df = self.sig_dat.edges_df
         self.nodes_df = self.sig_dat.nodes_df
-        self.graph = None
-        self._create_graph()
+
+    @cached_property
+    def graph(self):
+        """NetworkX graph, built on first access"""
+        return self._create_graph()
     
     def _create_graph(self):
         """Create NetworkX graph object from prepared dataframes"""
         if self.edges_df is None or self.edges_df.empty:
             print("❌ No edge data available for graph creation")
-            self.graph = nx.DiGraph()
-            return
+            return nx.DiGraph()
             
-        # Create graph from edges dataframe
-        self.graph = nx.from_pandas_edgelist(
-            self.edges_df, 
-            source='from', 
-            target='to', 
-            edge_attr=True,  # Include all edge attributes
-            create_using=nx.DiGraph(),
-            connectionstyle='arc3,rad=0.2'
-        )
+        # Create graph from edges dataframe; all other columns become edge
+        # attributes, converted to dicts in one pass
+        attr_df = self.edges_df.drop(columns=['from', 'to'])
+        src = self.edges_df['from'].to_numpy()
+        dst = self.edges_df['to'].to_numpy()
+        graph = nx.DiGraph()
+        if attr_df.columns.empty:
+            # to_dict('records') is [] here, which would truncate the zip
+            graph.add_edges_from(zip(src, dst, strict=True))
+        else:
+            graph.add_edges_from(zip(src, dst, attr_df.to_dict('records'), strict=True))
         
         # Add node attributes from nodes dataframe
         if self.nodes_df is not None and not self.nodes_df.empty:
             node_attrs = self.nodes_df.set_index('node').to_dict('index')
-            nx.set_node_attributes(self.graph, node_attrs)
+            nx.set_node_attributes(graph, node_attrs)
         
-        print(f"✅ Graph created: {self.graph.number_of_nodes()} nodes, {self.graph.number_of_edges()} edges")
+        print(f"✅ Graph created: {graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges")
+        return graph
     
 
     def get_networkx_graph(self):
         """Return the NetworkX graph object"""
-        return self.graph
\ No newline at end of file
+        return self.graph
+
+    def to_csr(self):
+        """
+        Compressed sparse row adjacency of the edge list.
+
+        Node labels are factorised to dense integer ids, so the out-neighbours
+        of node i are indices[indptr[i]:indptr[i + 1]].
+
+        Returns:
+        - indptr: row offsets, length N + 1
+        - indices: target id of each edge, grouped by source id and sorted
+          within each row
+        - id_to_label: array mapping integer id back to node label
+
+        Repeated rows for the same (from, to) pair give a single entry, so the
+        edge count matches the NetworkX graph. Rows with a missing from or to
+        (e.g. partly filled sheet rows) are left out, unlike the NetworkX
+        graph, which keeps them as NaN nodes.
+
+        The arrays are computed once; SigGraph is not modified after
+        construction.
+        """
+        return self._csr
+
+    @cached_property
+    def _csr(self):
+        """CSR arrays for to_csr, built on first access"""
+        if self.edges_df is None or self.edges_df.empty:
+            return (
+                np.zeros(1, dtype=np.int64),
+                np.empty(0, dtype=np.int64),
+                np.empty(0, dtype=object),
+            )
+
+        edges = self.edges_df.dropna(subset=['from', 'to'])
+        n_edges = len(edges)
+        codes, id_to_label = pd.factorize(np.concatenate([
+            edges['from'].to_numpy(),
+            edges['to'].to_numpy(),
+        ]))
+        n_nodes = len(id_to_label)
+
+        # repeated (from, to) rows collapse to one entry, as in the DiGraph;
+        # np.unique also leaves the pairs sorted by source, then target
+        pairs = np.unique(codes[:n_edges].astype(np.int64) * n_nodes + codes[n_edges:])
+        src, indices = np.divmod(pairs, n_nodes)
+
+        indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n_nodes), out=indptr[1:])
+        return indptr, indices, id_to_label
\ No newline at end of file
@@ -1,7 +1,6 @@
+from functools import cached_property, partial
 import pandas as pd
 import os
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
 import numpy as np
 import networkx as nx
 from scripts.classes.sig_graph import SigGraph
@@ -13,11 +12,21 @@ class SigVis:
     Uses SigGraph for data loading and graph operations.
     """
 
+    # layout functions by name, assembled once rather than per plot call;
+    # stochastic layouts are seeded so repeated plots match
+    _LAYOUTS = {
+        'spring': partial(nx.spring_layout, seed=0),
+        'circular': nx.circular_layout,
+        'shell': nx.shell_layout,
+        'random': partial(nx.random_layout, seed=0),
+    }
+
     def __init__(self, data_path=None):
         """
         Initialize SigVis with a SigGraph instance
                 """
         self.sig_graph = SigGraph(data_path=data_path)
+        self._layout_cache = {}
     
     @property
     def edges(self):
@@ -43,32 +52,103 @@ class SigVis:
             "to_minimum_requirements",
             "status"]]
 
-    def plot_role_contexts(self):
+    def plot_role_contexts(self, show=True, layout='spring', layout_kwargs=None):
+        """
+        Plot the network with nodes shaped and coloured by role context.
+
+        Parameters:
+        - show: display the figure with plt.show(); if False the figure is
+          returned instead, e.g. for saving or embedding
+        - layout: one of 'spring', 'circular', 'shell', 'random'
+        - layout_kwargs: extra arguments for the layout function, e.g.
+          {'k': 0.5, 'iterations': 100} for 'spring'
+        """
+        # imported here so data-only use of SigVis doesn't pay for matplotlib
+        import matplotlib.pyplot as plt
+
         G = self.graph
-        pos = nx.spring_layout(G)
-        node_attrs = self._node_plot_attributes()
-        plt.figure(figsize=(12, 8))
-        for shape in node_attrs['shape'].unique():
-            nodes = node_attrs[node_attrs['shape'] == shape].index
-            nx.draw_networkx_nodes(
-                G, pos,
-                nodelist=nodes,
-                node_color=node_attrs.loc[nodes, 'color'],
-                node_shape=shape,
-                node_size=2000,
-                alpha = 0.3
+        # pos_array rows are in graph node order, as are _shape_groups rows
+        pos, _, pos_array = self._get_layout(layout, layout_kwargs)
+        if show:
+            # named per instance and method, so repeated calls reuse one
+            # figure instead of accumulating new ones
+            fig = plt.figure(
+                num=f'sigvis_{id(self)}_plot_role_contexts', figsize=(12, 8), clear=True
+            )
+        else:
+            # a fresh figure the caller owns, not tracked by pyplot, so it
+            # is neither overwritten by later calls nor leaked
+            from matplotlib.figure import Figure
+            fig = Figure(figsize=(12, 8))
+        ax = fig.add_subplot(111)
+        # one scatter per marker shape; matplotlib can't mix markers in one call
+        for shape, (rows, colors) in self._shape_groups.items():
+            xy = pos_array[rows]
+            ax.scatter(
+                xy[:, 0], xy[:, 1],
+                c=colors,
+                marker=shape,
+                s=2000,
+                alpha=0.3,
+                zorder=2
         )       
         nx.draw_networkx_edges(G, 
             pos, 
             edge_color='gray', 
             alpha=0.5, 
             arrows=True,
-            connectionstyle='arc3,rad=0.2'
+            connectionstyle='arc3,rad=0.2',
+            ax=ax
         )
-        nx.draw_networkx_labels(G, pos)
-        plt.title("structured intelligence governance minimal presentation")
+        nx.draw_networkx_labels(G, pos, ax=ax)
+        ax.set_title("structured intelligence governance minimal presentation")
+        if not show:
+            return fig
         plt.show()    
 
+    def _get_layout(self, layout='spring', layout_kwargs=None):
+        """
+        Node positions for a named layout, computed once per set of arguments.
+
+        Returns (pos, node_to_idx, pos_array): the position dict networkx
+        drawers take, plus the same positions as an (N, 2) float array in
+        graph node order and a node -> row map, built once per layout.
+
+        Calls whose layout_kwargs are all hashable (e.g. k, iterations) are
+        cached; unhashable ones (e.g. pos={...}, fixed=[...]) are computed
+        fresh each time. Use reset_layout_cache() to force a fresh layout.
+        """
+        if layout not in self._LAYOUTS:
+            raise ValueError(f"layout must be one of {', '.join(map(repr, self._LAYOUTS))}")
+        layout_kwargs = layout_kwargs or {}
+        key = (layout, tuple(sorted(layout_kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return self._compute_layout(layout, layout_kwargs)
+        if key not in self._layout_cache:
+            self._layout_cache[key] = self._compute_layout(layout, layout_kwargs)
+        return self._layout_cache[key]
+
+    def _compute_layout(self, layout, layout_kwargs):
+        pos = self._LAYOUTS[layout](self.graph, **layout_kwargs)
+        node_to_idx = {node: i for i, node in enumerate(self.graph)}
+        pos_array = np.array([pos[node] for node in self.graph], dtype=np.float64).reshape(-1, 2)
+        return pos, node_to_idx, pos_array
+
+    def layout_arrays(self, layout='spring', layout_kwargs=None):
+        """
+        Cached layout as (node_to_idx, pos_array), for vectorised work on
+        node coordinates such as cluster centroids.
+        """
+        _, node_to_idx, pos_array = self._get_layout(layout, layout_kwargs)
+        return node_to_idx, pos_array
+
+    def reset_layout_cache(self):
+        """Drop cached node positions so the next plot recomputes them"""
+        self._layout_cache.clear()
+
+    @cached_property
     def _node_plot_attributes(self):
         
         # set palette
@@ -84,4 +164,19 @@ class SigVis:
         return self.nodes.assign(
             shape=lambda df: np.where(df['role_context'] == 'humans', 'o', 's'),
             color=lambda df: df['role_context'].map(color_palette)
-        ).set_index('node')
\ No newline at end of file
+        ).set_index('node')
+
+    @cached_property
+    def _shape_groups(self):
+        """
+        Graph-order row indices and colours per marker shape, as arrays ready
+        for indexing a layout's position array
+        """
+        graph_nodes = pd.Index(list(self.graph))
+        groups = {}
+        for shape, group in self._node_plot_attributes.groupby('shape', sort=False):
+            rows = graph_nodes.get_indexer(group.index)
+            if (rows < 0).any():
+                raise KeyError(f"nodes not in graph: {list(group.index[rows < 0])}")
+            groups[shape] = (rows, group['color'].to_numpy())
+        return groups